@@ -1,5 +1,5 @@
 import os
-import json
+import orjson
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
@@ -7,7 +7,6 @@ from hdbscan import HDBSCAN
 from sklearn.cluster import DBSCAN
 from sklearn.metrics import silhouette_score
 from sklearn.preprocessing import StandardScaler
-from scipy import stats
 import warnings
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import multiprocessing
@@ -17,6 +16,60 @@ warnings.filterwarnings("ignore", category=FutureWarning, message=".*force_all_f
 # OPTIMIZATION: Use all available CPU cores for parallel processing
 MAX_WORKERS = max(1, multiprocessing.cpu_count() - 1)
 
+# Bytes of encoded GeoJSON to collect before each write when streaming exports
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Decimal places kept for exported feature coordinates
+COORD_DECIMALS = 6
+
+
+def _fit_sub_clusters(weighted_features, accident_count, n_jobs=-1):
+    """Sub-cluster one oversized cluster (module-level so worker processes can run it)"""
+    sub_clusterer = HDBSCAN(
+        min_cluster_size=max(10, accident_count // 20),
+        min_samples=max(5, accident_count // 40),
+        metric='euclidean',
+        cluster_selection_epsilon=0.1,
+        core_dist_n_jobs=n_jobs  # OPTIMIZATION: All cores, or this worker's share of them
+    )
+    return np.asarray(sub_clusterer.fit_predict(weighted_features))
+
+
+def _fit_gpu_hdbscan(coords_rad, min_cluster_size, min_samples, cluster_selection_epsilon):
+    """Fit HDBSCAN with cuML on the GPU; returns None when cuML is not installed"""
+    try:
+        from cuml.cluster import HDBSCAN as GPUHDBSCAN
+    except ImportError:
+        return None
+
+    # cuML has no haversine metric: cluster unit-sphere points instead, where the
+    # chord length 2*sin(d/2) is effectively the arc length d at city scale
+    lat, lon = coords_rad[:, 0], coords_rad[:, 1]
+    xyz = np.ascontiguousarray(
+        np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)]),
+        dtype=np.float32
+    )
+
+    clusterer = GPUHDBSCAN(
+        min_cluster_size=min_cluster_size,
+        min_samples=min_samples,
+        cluster_selection_epsilon=float(2 * np.sin(cluster_selection_epsilon / 2)),
+        output_type="numpy"
+    )
+    return np.asarray(clusterer.fit_predict(xyz))
+
+
+def _dump_json(obj, path, pretty=False):
+    """OPTIMIZED: Serialize with orjson (minified unless pretty) and write the bytes directly"""
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    data = orjson.dumps(obj, option=option)
+
+    with open(path, "wb") as f:
+        f.write(data)
+
+
 class AccidentClusterAnalyzer:
     def __init__(self, filename="accidents.geojson"):
         # Use script_dir + data folder like before
@@ -43,21 +96,18 @@ class AccidentClusterAnalyzer:
         if not os.path.exists(self.file_path):
             return False
 
-        with open(self.file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        # OPTIMIZATION: Use list comprehension (faster than loop)
-        records = [
-            {
-                "longitude": feat["geometry"]["coordinates"][0],
-                "latitude": feat["geometry"]["coordinates"][1],
-                **feat["properties"]
-            }
-            for feat in data["features"]
-            if feat["geometry"]["type"] == "Point"
-        ]
+        # OPTIMIZATION: orjson parses straight from bytes (2-3x faster than json)
+        with open(self.file_path, "rb") as f:
+            data = orjson.loads(f.read())
 
-        self.df = pd.DataFrame(records)
+        point_features = [feat for feat in data["features"] if feat["geometry"]["type"] == "Point"]
+        coords = np.array(
+            [feat["geometry"]["coordinates"][:2] for feat in point_features], dtype=np.float64
+        ).reshape(-1, 2)
+
+        self.df = pd.DataFrame([feat["properties"] for feat in point_features])
+        self.df["longitude"] = coords[:, 0]
+        self.df["latitude"] = coords[:, 1]
         return True
 
     def preprocess_data(self):
@@ -94,9 +144,10 @@ class AccidentClusterAnalyzer:
         if accident_dates is None:
             accident_dates = self.df['date']
         
-        # OPTIMIZATION: Pure numpy operations (10x faster than pandas iterrows)
-        days_from_now = (self.current_date - accident_dates).dt.days
-        weights = np.exp(-self.decay_rate * days_from_now / 365.25)
+        # OPTIMIZATION: Whole days with NumPy in the column's own unit (no Timedelta Series,
+        # no ns cast that would overflow for dates outside 1677-2262)
+        days_from_now = (np.datetime64(self.current_date) - accident_dates.to_numpy()) // np.timedelta64(1, 'D')
+        weights = np.exp((-self.decay_rate / 365.25) * days_from_now)
         
         return weights
     
@@ -114,30 +165,48 @@ class AccidentClusterAnalyzer:
             'lon': locations[:, 1]
         })
         
-        df_trend['year_month'] = df_trend['date'].dt.to_period('M')
+        # OPTIMIZATION: Integer month key (year * 12 + month) instead of Period objects
+        df_trend['year_month'] = (
+            df_trend['date'].dt.year.astype('int32') * 12 + df_trend['date'].dt.month.astype('int32')
+        )
         
         # OPTIMIZATION: Reduced bins for faster processing (30 instead of 50)
         # This gives us 900 spatial bins instead of 2,500 (3x faster, similar accuracy)
-        lat_bins = pd.cut(df_trend['lat'], bins=30)
-        lon_bins = pd.cut(df_trend['lon'], bins=30)
-        df_trend['spatial_bin'] = lat_bins.astype(str) + '_' + lon_bins.astype(str)
+        # OPTIMIZATION: Integer bin codes instead of string keys for faster grouping
+        n_bins = 30
+        lat_code = pd.cut(df_trend['lat'], bins=n_bins, labels=False)
+        lon_code = pd.cut(df_trend['lon'], bins=n_bins, labels=False)
+        df_trend['spatial_bin'] = (lat_code * n_bins + lon_code).astype('int32')
         
         # Count accidents per spatial bin per month
         monthly_counts = df_trend.groupby(['spatial_bin', 'year_month']).size().reset_index(name='count')
         
-        # Calculate trend for each spatial bin
-        trends = {}
-        for spatial_bin in monthly_counts['spatial_bin'].unique():
-            bin_data = monthly_counts[monthly_counts['spatial_bin'] == spatial_bin]
-            
-            if len(bin_data) >= 3:  # Need minimum points for trend
-                x = np.arange(len(bin_data))
-                y = bin_data['count'].values
-                slope, _, r_value, _, _ = stats.linregress(x, y)
-                trends[spatial_bin] = slope if abs(r_value) > 0.3 else 0  # Only significant trends
-            else:
-                trends[spatial_bin] = 0
-        
+        # OPTIMIZATION: Closed-form least squares for every spatial bin at once
+        # (replaces a per-bin stats.linregress loop)
+        monthly_counts['x'] = monthly_counts.groupby('spatial_bin').cumcount()
+        x = monthly_counts['x'].astype(float)
+        y = monthly_counts['count'].astype(float)
+        bin_keys = monthly_counts['spatial_bin']
+
+        g = monthly_counts.groupby('spatial_bin')
+        n = g.size()
+        sx = x.groupby(bin_keys).sum()
+        sy = y.groupby(bin_keys).sum()
+        sxx = (x * x).groupby(bin_keys).sum()
+        sxy = (x * y).groupby(bin_keys).sum()
+        syy = (y * y).groupby(bin_keys).sum()
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = n * sxy - sx * sy
+            var_x = n * sxx - sx * sx
+            var_y = n * syy - sy * sy
+            slope = cov / var_x
+            r_value = cov / np.sqrt(var_x * var_y)
+
+        # Only significant trends, and need minimum points for trend
+        slope = slope.where(np.abs(r_value) > 0.3, 0).where(n >= 3, 0)
+        trends = slope.to_dict()
+
         # Map trends back to original data points
         df_trend['trend'] = df_trend['spatial_bin'].map(trends).fillna(0)
         
@@ -147,11 +216,13 @@ class AccidentClusterAnalyzer:
         """Calculate composite danger score for a cluster"""
         if len(cluster_data) == 0:
             return 0
-        
-        cluster_weights = self.calculate_temporal_weights(cluster_data['date'])
+
+        # OPTIMIZATION: Reuse the per-point weights computed once in perform_clustering
+        cluster_weights = cluster_data['temporal_weight'].to_numpy()
+        # Trend is binned over this cluster's own extent (not the dataset-wide trend_score)
         cluster_coords = cluster_data[['latitude', 'longitude']].values
         cluster_trends = self.analyze_accident_trends(cluster_coords, cluster_data['date'])
-        
+
         temporal_component = np.mean(cluster_weights) * 0.4
         trend_component = max(0, np.mean(cluster_trends)) * 0.3
         frequency_component = min(len(cluster_data) / 100, 1.0) * 0.3
@@ -161,20 +232,26 @@ class AccidentClusterAnalyzer:
     # ======================================================
     # MAIN CLUSTERING (WITH PROGRESS)
     # ======================================================
-    def perform_clustering(self, min_cluster_size=15, min_samples=5, cluster_selection_epsilon=0.0001):
-        """OPTIMIZED: Uses all CPU cores for faster processing"""
-        coords = np.radians(self.df[["latitude", "longitude"]].values)
-        
-        clusterer = HDBSCAN(
-            min_cluster_size=min_cluster_size,
-            min_samples=min_samples,
-            metric="haversine",
-            cluster_selection_epsilon=cluster_selection_epsilon,
-            core_dist_n_jobs=-1  # OPTIMIZATION: Use all cores for distance calculations
-        )
-        
-        labels = clusterer.fit_predict(coords)
-        self.df["cluster"] = labels
+    def perform_clustering(self, min_cluster_size=15, min_samples=5, cluster_selection_epsilon=0.0001, use_gpu=False):
+        """OPTIMIZED: Uses all CPU cores (or cuML on a GPU when use_gpu=True) for faster processing"""
+        coords = np.radians(self.df[["latitude", "longitude"]].to_numpy(np.float64))
+        
+        labels = None
+        if use_gpu:
+            labels = _fit_gpu_hdbscan(coords, min_cluster_size, min_samples, cluster_selection_epsilon)
+        
+        if labels is None:
+            clusterer = HDBSCAN(
+                min_cluster_size=min_cluster_size,
+                min_samples=min_samples,
+                metric="haversine",
+                cluster_selection_epsilon=cluster_selection_epsilon,
+                core_dist_n_jobs=-1  # OPTIMIZATION: Use all cores for distance calculations
+            )
+            
+            labels = clusterer.fit_predict(coords)
+        # OPTIMIZATION: int32 labels halve the cluster column's memory traffic
+        self.df["cluster"] = labels.astype(np.int32)
         self.clustered_df = self.df.copy()
         
         self.temporal_weights = self.calculate_temporal_weights()
@@ -198,12 +275,16 @@ class AccidentClusterAnalyzer:
             
         clusters_to_process = self.clustered_df["cluster"].unique()
         next_cluster_id = self.clustered_df["cluster"].max() + 1
+        # OPTIMIZATION: Row positions of every cluster in one pass (no per-cluster mask)
+        cluster_positions = self.clustered_df.groupby("cluster").indices
         
+        # Build the feature matrix of every oversized cluster first
+        jobs = []
         for cid in clusters_to_process:
             if cid == -1:
                 continue
                 
-            cluster_points = self.clustered_df[self.clustered_df["cluster"] == cid]
+            cluster_points = self.clustered_df.iloc[cluster_positions[cid]]
             accident_count = len(cluster_points)
             
             if accident_count > max_accidents:
@@ -223,33 +304,38 @@ class AccidentClusterAnalyzer:
                     cluster_trends * 10
                 ])
                 
-                sub_clusterer = HDBSCAN(
-                    min_cluster_size=max(10, accident_count // 20),
-                    min_samples=max(5, accident_count // 40),
-                    metric='euclidean',
-                    cluster_selection_epsilon=0.1,
-                    core_dist_n_jobs=-1  # OPTIMIZATION: Use all cores
-                )
-                
-                sub_labels = sub_clusterer.fit_predict(weighted_features)
-                
-                unique_sub_labels = set(sub_labels)
-                n_sub_clusters = len(unique_sub_labels) - (1 if -1 in unique_sub_labels else 0)
+                jobs.append((cluster_points.index, weighted_features, accident_count))
+        
+        # OPTIMIZATION: Independent HDBSCAN fits run in parallel, one process per cluster
+        features = [job[1] for job in jobs]
+        counts = [job[2] for job in jobs]
+        n_workers = min(MAX_WORKERS, len(jobs))
+        if n_workers > 1:
+            # Split the cores between workers so each fit still parallelizes its core distances
+            jobs_per_worker = max(1, MAX_WORKERS // n_workers)
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                results = list(executor.map(_fit_sub_clusters, features, counts, [jobs_per_worker] * len(jobs)))
+        else:
+            # One job or one usable core: fit in-process, each fit using every core
+            results = [_fit_sub_clusters(f, c) for f, c in zip(features, counts)]
+        
+        # Merge in submission order so new cluster IDs are deterministic
+        for (point_index, _, _), sub_labels in zip(jobs, results):
+            # OPTIMIZATION: Vectorized label counting (no Python set/list over every point)
+            unique_sub_labels, first_seen = np.unique(sub_labels, return_index=True)
+            is_cluster = unique_sub_labels != -1
+            unique_sub_labels = unique_sub_labels[is_cluster]
+            n_sub_clusters = int(unique_sub_labels.size)
+            
+            if n_sub_clusters > 1:
+                # New IDs are handed out in order of first appearance, as before
+                ordered = unique_sub_labels[np.argsort(first_seen[is_cluster])]
+                label_mapping = np.full(sub_labels.max() + 1, -1, dtype=np.int32)
+                label_mapping[ordered] = np.arange(next_cluster_id, next_cluster_id + n_sub_clusters)
+                next_cluster_id += n_sub_clusters
                 
-                if n_sub_clusters > 1:
-                    mapped_labels = []
-                    label_mapping = {}
-                    
-                    for label in sub_labels:
-                        if label == -1:
-                            mapped_labels.append(-1)
-                        else:
-                            if label not in label_mapping:
-                                label_mapping[label] = next_cluster_id
-                                next_cluster_id += 1
-                            mapped_labels.append(label_mapping[label])
-                    
-                    self.clustered_df.loc[cluster_points.index, "cluster"] = mapped_labels
+                mapped_labels = np.where(sub_labels == -1, -1, label_mapping[sub_labels])
+                self.clustered_df.loc[point_index, "cluster"] = mapped_labels
         
         self.remove_cluster_outliers()
         self.renumber_clusters_sequentially()
@@ -262,17 +348,18 @@ class AccidentClusterAnalyzer:
         if self.clustered_df is None:
             return
         
-        for cid in self.clustered_df["cluster"].unique():
+        # OPTIMIZATION: Convert all rows once, then slice by each cluster's row positions
+        coords_rad = np.radians(self.clustered_df[["latitude", "longitude"]].to_numpy(np.float64))
+        cluster_positions = self.clustered_df.groupby("cluster").indices
+        
+        for cid, positions in cluster_positions.items():
             if cid == -1:
                 continue
             
-            cluster_mask = self.clustered_df["cluster"] == cid
-            cluster_points = self.clustered_df[cluster_mask]
-            
-            if len(cluster_points) < 5:
+            if len(positions) < 5:
                 continue
             
-            coords = np.radians(cluster_points[["latitude", "longitude"]].values)
+            coords = coords_rad[positions]
             centroid = coords.mean(axis=0)
             distances = np.sqrt(((coords - centroid) ** 2).sum(axis=1))
             
@@ -284,7 +371,7 @@ class AccidentClusterAnalyzer:
             n_outliers = outlier_mask.sum()
             
             if n_outliers > 0:
-                outlier_indices = cluster_points[outlier_mask].index
+                outlier_indices = self.clustered_df.index[positions[outlier_mask]]
                 self.clustered_df.loc[outlier_indices, "cluster"] = -1
 
     def renumber_clusters_sequentially(self):
@@ -300,7 +387,7 @@ class AccidentClusterAnalyzer:
         cluster_mapping = {old_id: new_id for new_id, old_id in enumerate(unique_clusters)}
         cluster_mapping[-1] = -1
         
-        self.clustered_df["cluster"] = self.clustered_df["cluster"].map(cluster_mapping)
+        self.clustered_df["cluster"] = self.clustered_df["cluster"].map(cluster_mapping).astype(np.int32)
 
     # ======================================================
     # CLUSTER STATS (SIMPLIFIED FOR SPEED)
@@ -308,23 +395,39 @@ class AccidentClusterAnalyzer:
     def calculate_cluster_centers(self):
         """OPTIMIZED: Simplified validation logic for faster processing"""
         stats = []
-        
-        # OPTIMIZATION: Use groupby for faster processing
-        for cid, subset in self.clustered_df[self.clustered_df["cluster"] != -1].groupby("cluster"):
+        recent_cutoff = self.current_date - timedelta(days=365)
+
+        clustered_points = self.clustered_df[self.clustered_df["cluster"] != -1]
+        labels = clustered_points["cluster"].to_numpy()
+
+        # OPTIMIZATION: Per-cluster sums/counts with np.bincount (one C pass per column)
+        counts = np.bincount(labels)
+        cluster_ids = np.flatnonzero(counts)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            center_lats = np.bincount(labels, weights=clustered_points["latitude"].to_numpy()) / counts
+            center_lons = np.bincount(labels, weights=clustered_points["longitude"].to_numpy()) / counts
+            avg_weights = np.bincount(labels, weights=clustered_points["temporal_weight"].to_numpy()) / counts
+            avg_trends = np.bincount(labels, weights=clustered_points["trend_score"].to_numpy()) / counts
+        # OPTIMIZATION: Compare dates once for all rows instead of once per cluster
+        is_recent = (clustered_points["date"] > recent_cutoff).to_numpy()
+        recent_counts = np.bincount(labels, weights=is_recent, minlength=len(counts))
+        group_indices = clustered_points.groupby("cluster").indices
+        has_barangay = "barangay" in clustered_points.columns
+
+        for cid in cluster_ids:
+            subset = clustered_points.iloc[group_indices[cid]]
             danger_score = self.calculate_danger_score(subset)
-            recent_cutoff = self.current_date - timedelta(days=365)
-            recent_accidents = len(subset[subset['date'] > recent_cutoff])
-            
+
             stats.append({
                 "cluster_id": int(cid),
-                "center_lat": subset["latitude"].mean(),
-                "center_lon": subset["longitude"].mean(),
-                "accident_count": len(subset),
+                "center_lat": float(center_lats[cid]),
+                "center_lon": float(center_lons[cid]),
+                "accident_count": int(counts[cid]),
                 "danger_score": round(danger_score, 4),
-                "recent_accidents": recent_accidents,
-                "avg_temporal_weight": round(subset['temporal_weight'].mean(), 4),
-                "avg_trend_score": round(subset['trend_score'].mean(), 4),
-                "barangays": subset["barangay"].dropna().unique().tolist() if "barangay" in subset.columns else []
+                "recent_accidents": int(recent_counts[cid]),
+                "avg_temporal_weight": round(float(avg_weights[cid]), 4),
+                "avg_trend_score": round(float(avg_trends[cid]), 4),
+                "barangays": subset["barangay"].dropna().unique().tolist() if has_barangay else []
             })
         
         # OPTIMIZATION: Simplified year validation (keep essential logic only)
@@ -395,53 +498,93 @@ class AccidentClusterAnalyzer:
     # ======================================================
     # EXPORT (OPTIMIZED)
     # ======================================================
-    def export_to_geojson(self, filename="accidents_clustered.geojson"):
-        """OPTIMIZED: Faster GeoJSON export"""
-        if self.clustered_df is None:
-            return
-        
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        data_folder = os.path.join(script_dir, "data")
-        os.makedirs(data_folder, exist_ok=True)
-        output = os.path.join(data_folder, filename)
+    def _iter_features(self, chunk_size=10000):
+        """Yield accident point and cluster center features one at a time"""
+        # OPTIMIZATION: Vectorized property conversion (column-wise, no iterrows)
+        # Six decimals (~0.1 m) is all the precision GPS coordinates carry; round once for all rows
+        coordinates = np.round(self.clustered_df[["longitude", "latitude"]].to_numpy(), COORD_DECIMALS)
+        point_props = self.clustered_df.drop(columns=["longitude", "latitude"])
+
+        for col in point_props.columns:
+            values = point_props[col]
+            if pd.api.types.is_datetime64_any_dtype(values):
+                # Same text as Timestamp.isoformat(): microseconds only when non-zero
+                converted = (
+                    values.dt.strftime('%Y-%m-%dT%H:%M:%S.%f')
+                    .str.replace(r'\.000000$', '', regex=True)
+                    .astype(object)
+                )
+            else:
+                converted = values.astype(object)
+            point_props[col] = converted.where(values.notna(), None)
+
+        point_props["type"] = "accident_point"
+
+        # OPTIMIZATION: Materialize property dicts chunk by chunk to bound peak memory
+        for start in range(0, len(point_props), chunk_size):
+            stop = start + chunk_size
+            records = point_props.iloc[start:stop].to_dict(orient="records")
+            for coords, properties in zip(coordinates[start:stop].tolist(), records):
+                yield {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": coords},
+                    "properties": properties
+                }
 
-        features = []
-        
-        # OPTIMIZATION: Vectorized property conversion
-        for _, row in self.clustered_df.iterrows():
-            properties = {k: (v.item() if isinstance(v, (np.integer, np.floating)) else
-                            v.tolist() if isinstance(v, np.ndarray) else
-                            None if pd.isna(v) else
-                            v.isoformat() if isinstance(v, pd.Timestamp) else v)
-                         for k, v in row.items() if k not in ["longitude", "latitude"]}
-            
-            properties["type"] = "accident_point"
-            
-            features.append({
-                "type": "Feature",
-                "geometry": {"type": "Point", "coordinates": [row["longitude"], row["latitude"]]},
-                "properties": properties
-            })
-        
         # Add cluster centers
         if self.cluster_centers:
             for cluster in self.cluster_centers:
                 cluster_properties = cluster.copy()
                 cluster_properties["type"] = "cluster_center"
                 
-                features.append({
+                yield {
                     "type": "Feature",
-                    "geometry": {"type": "Point", "coordinates": [cluster["center_lon"], cluster["center_lat"]]},
+                    "geometry": {
+                        "type": "Point",
+                        "coordinates": [round(cluster["center_lon"], COORD_DECIMALS), round(cluster["center_lat"], COORD_DECIMALS)]
+                    },
                     "properties": cluster_properties
-                })
-        
-        geojson = {"type": "FeatureCollection", "features": features}
+                }
+
+    def export_to_geojson(self, filename="accidents_clustered.geojson", pretty=False):
+        """OPTIMIZED: Streams minified features to disk instead of building one big dict"""
+        if self.clustered_df is None:
+            return
         
-        with open(output, "w", encoding="utf-8") as f:
-            json.dump(geojson, f, indent=2, ensure_ascii=False)
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        data_folder = os.path.join(script_dir, "data")
+        os.makedirs(data_folder, exist_ok=True)
+        output = os.path.join(data_folder, filename)
+
+        if pretty:
+            # Debug output: indented, so build the whole collection in memory
+            _dump_json({"type": "FeatureCollection", "features": list(self._iter_features())}, output, pretty=True)
+            return
+
+        # Stream to a temp file and swap it in at the end, so a failure mid-export
+        # never replaces the previous good file with a truncated one
+        tmp_output = output + ".tmp"
+        try:
+            with open(tmp_output, "wb") as f:
+                # OPTIMIZATION: Accumulate ~1 MB of encoded features per write (few syscalls)
+                buffer = bytearray(b'{"type":"FeatureCollection","features":[')
+                for i, feature in enumerate(self._iter_features()):
+                    if i:
+                        buffer += b","
+                    buffer += orjson.dumps(feature, option=orjson.OPT_SERIALIZE_NUMPY)
+                    if len(buffer) >= WRITE_BUFFER_SIZE:
+                        f.write(buffer)
+                        buffer.clear()
+                buffer += b"]}"
+                f.write(buffer)
+            os.replace(tmp_output, output)
+        except BaseException:
+            if os.path.exists(tmp_output):
+                os.remove(tmp_output)
+            raise
 
-    def export_cluster_centers(self, filename="cluster_centers.json"):
-        """Export cluster centers"""
+    def export_cluster_centers(self, filename="cluster_centers.json", pretty=False):
+        """Export cluster centers (minified unless pretty)"""
         if not self.cluster_centers:
             return
         
@@ -449,13 +592,12 @@ class AccidentClusterAnalyzer:
         data_folder = os.path.join(script_dir, "data")
         output = os.path.join(data_folder, filename)
             
-        with open(output, "w", encoding="utf-8") as f:
-            json.dump(self.cluster_centers, f, indent=2, ensure_ascii=False)
+        _dump_json(self.cluster_centers, output, pretty=pretty)
 
     # ======================================================
     # MAIN PIPELINE (WITH TIMING)
     # ======================================================
-    def main(self, auto_tune=False, export_alerts=False):
+    def main(self, auto_tune=False, export_alerts=False, use_gpu=False):
         """OPTIMIZED: Main pipeline - runs silently, progress shown by backend"""
         if not self.load_geojson_data():
             return
@@ -473,7 +615,8 @@ class AccidentClusterAnalyzer:
         self.perform_clustering(
             min_cluster_size=min_cluster_size,
             min_samples=min_samples,
-            cluster_selection_epsilon=epsilon
+            cluster_selection_epsilon=epsilon,
+            use_gpu=use_gpu
         )
         
         self.temporal_subcluster_large_clusters()